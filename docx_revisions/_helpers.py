@@ -8,91 +8,179 @@ elements and the ``before / del / ins / after`` splice used by both
 from __future__ import annotations
 
 import contextlib
-from typing import Callable
+import copy
+import itertools
+from typing import Callable, List
 
-from docx.oxml.ns import qn
+from docx.oxml.ns import nsmap, qn
 from docx.oxml.parser import OxmlElement
 from lxml import etree
 
+# Clark-notation tag and attribute names, resolved once at import time so the
+# per-element hot paths don't pay for a ``qn()`` prefix lookup on every call.
+W_R = qn("w:r")
+W_RPR = qn("w:rPr")
+W_T = qn("w:t")
+W_DELTEXT = qn("w:delText")
+W_INS = qn("w:ins")
+W_DEL = qn("w:del")
+W_HYPERLINK = qn("w:hyperlink")
+W_P = qn("w:p")
+W_TBL = qn("w:tbl")
+W_ID = qn("w:id")
+W_AUTHOR = qn("w:author")
+W_DATE = qn("w:date")
+XML_SPACE = qn("xml:space")
+
+# Child-axis element selections use ``iterchildren(*tags)``, which filters in C.
+# XPath is kept for descendant searches and for pulling text nodes directly,
+# compiled once rather than re-parsed by ``BaseOxmlElement.xpath()`` per call.
+DOCUMENT_REVISIONS_XPATH = etree.XPath("//w:ins | //w:del", namespaces=nsmap)
+DEL_TEXT_XPATH = etree.XPath(".//w:delText", namespaces=nsmap)
+# Plain ``str`` results (``smart_strings=False``) skip building lxml smart strings.
+RUN_TEXT_XPATH = etree.XPath("./w:t/text() | ./w:delText/text()", namespaces=nsmap, smart_strings=False)
+# Text of the runs reachable from paragraph ``$p`` through ``w:ins`` (accepted
+# view) or ``w:del`` (original view) wrappers only: a run qualifies when its
+# nearest ancestor that is not such a wrapper is ``$p`` itself.  Runs under
+# the other wrapper, hyperlinks, or text-box paragraphs are excluded.
+ACCEPTED_TEXT_XPATH = etree.XPath(
+    ".//w:r[count(ancestor::*[not(self::w:ins)][1] | $p) = 1]/*[self::w:t or self::w:delText]/text()",
+    namespaces=nsmap,
+    smart_strings=False,
+)
+ORIGINAL_TEXT_XPATH = etree.XPath(
+    ".//w:r[count(ancestor::*[not(self::w:del)][1] | $p) = 1]/*[self::w:t or self::w:delText]/text()",
+    namespaces=nsmap,
+    smart_strings=False,
+)
+
 
 def revision_attrs(rev_id: int, author: str, now: str) -> dict[str, str]:
     """Build the standard ``{w:id, w:author, w:date}`` attribute dict."""
-    return {qn("w:id"): str(rev_id), qn("w:author"): author, qn("w:date"): now}
+    return {W_ID: str(rev_id), W_AUTHOR: author, W_DATE: now}
+
+
+def run_text(r: etree._Element) -> str:
+    """Concatenate the ``w:t`` and ``w:delText`` children of run *r* in one pass.
+
+    Most runs are a single ``w:t``, optionally after a ``w:rPr``; that shape is
+    read straight off the element without evaluating the XPath.
+    """
+    n = len(r)
+    if 0 < n <= 2:
+        last = r[-1]
+        if last.tag == W_T and (n == 1 or r[0].tag == W_RPR):
+            return last.text or ""
+    return "".join(RUN_TEXT_XPATH(r))
+
+
+def _element_chain(*tags: str) -> OxmlElement:
+    """Build ``<tags[0]><tags[1]>...</tags[1]></tags[0]>``, each tag nested in the previous one."""
+    root = elem = OxmlElement(tags[0])
+    for tag in tags[1:]:
+        child = OxmlElement(tag)
+        elem.append(child)
+        elem = child
+    return root
+
+
+# Empty skeletons for the builders below.  One ``copy.deepcopy`` of a small
+# subtree is a single lxml copy, cheaper than an ``OxmlElement`` call per node.
+_TEXT_RUN_TEMPLATE = _element_chain("w:r", "w:t")
+_DEL_TEMPLATE = _element_chain("w:del", "w:r", "w:delText")
+_INS_TEMPLATE = _element_chain("w:ins", "w:r", "w:t")
+_WRAPPER_TEMPLATES = {"w:ins": _element_chain("w:ins"), "w:del": _element_chain("w:del")}
+
+
+def _clone_revision(template: OxmlElement, author: str, rev_id: int, now: str) -> OxmlElement:
+    """Copy *template* and stamp the copy with the ``w:id`` / ``w:author`` / ``w:date`` attributes."""
+    elem = copy.deepcopy(template)
+    elem.attrib.update(revision_attrs(rev_id, author, now))
+    return elem
+
+
+def make_revision_wrapper(tag: str, author: str, rev_id: int, now: str) -> OxmlElement:
+    """Create an empty ``w:ins`` or ``w:del`` element (per *tag*) with revision attributes."""
+    return _clone_revision(_WRAPPER_TEMPLATES[tag], author, rev_id, now)
+
+
+def _set_text(t: etree._Element, text: str) -> None:
+    """Set *t*'s text, adding ``xml:space="preserve"`` only when leading or trailing whitespace needs it."""
+    t.text = text
+    if len(text.strip()) < len(text):
+        t.set(XML_SPACE, "preserve")
 
 
 def make_text_run(text: str) -> OxmlElement:
     """Create a ``<w:r><w:t>text</w:t></w:r>`` element with space preservation."""
-    r = OxmlElement("w:r")
-    t = OxmlElement("w:t")
-    t.text = text
-    if text.startswith(" ") or text.endswith(" "):
-        t.set(qn("xml:space"), "preserve")
-    r.append(t)
+    r = copy.deepcopy(_TEXT_RUN_TEMPLATE)
+    _set_text(r[0], text)
     return r
 
 
 def make_del_element(deleted_text: str, author: str, rev_id: int, now: str) -> OxmlElement:
-    """Create a ``<w:del><w:r><w:delText>text</w:delText></w:r></w:del>`` element."""
-    del_elem = OxmlElement("w:del", attrs=revision_attrs(rev_id, author, now))
-    del_r = OxmlElement("w:r")
-    del_text_elem = OxmlElement("w:delText")
-    del_text_elem.text = deleted_text
-    del_r.append(del_text_elem)
-    del_elem.append(del_r)
+    """Create a ``<w:del><w:r><w:delText>text</w:delText></w:r></w:del>`` element with space preservation."""
+    del_elem = _clone_revision(_DEL_TEMPLATE, author, rev_id, now)
+    _set_text(del_elem[0][0], deleted_text)
     return del_elem
 
 
 def make_ins_element(insert_text: str, author: str, rev_id: int, now: str) -> OxmlElement:
-    """Create a ``<w:ins><w:r><w:t>text</w:t></w:r></w:ins>`` element."""
-    ins_elem = OxmlElement("w:ins", attrs=revision_attrs(rev_id, author, now))
-    ins_r = OxmlElement("w:r")
-    ins_t = OxmlElement("w:t")
-    ins_t.text = insert_text
-    ins_r.append(ins_t)
-    ins_elem.append(ins_r)
+    """Create a ``<w:ins><w:r><w:t>text</w:t></w:r></w:ins>`` element with space preservation."""
+    ins_elem = _clone_revision(_INS_TEMPLATE, author, rev_id, now)
+    _set_text(ins_elem[0][0], insert_text)
     return ins_elem
 
 
 def splice_tracked_replace(
-    parent: etree._Element,
-    index: int,
+    anchor: etree._Element,
     before_text: str | None,
     deleted_text: str,
-    insert_text: str,
+    insert_text: str | None,
     after_text: str | None,
     author: str,
     next_id_fn: Callable[[], int],
     now: str,
-) -> int:
-    """Insert the before-run / w:del / w:ins / after-run sequence into *parent* at *index*.
+) -> List[etree._Element]:
+    """Insert the before-run / w:del / w:ins / after-run sequence immediately before *anchor*.
+
+    Elements are linked in with ``addprevious()`` so the parent's children
+    never need to be listed and scanned for an insertion index.  *anchor*
+    itself is left in place for the caller to remove.  The ``w:ins`` is
+    omitted when *insert_text* is None, leaving a plain tracked deletion.
 
     Returns:
-        The number of elements inserted.
+        The inserted elements, in document order.
     """
-    insert_idx = index
+    inserted: List[etree._Element] = []
     if before_text:
-        parent.insert(insert_idx, make_text_run(before_text))
-        insert_idx += 1
-
-    parent.insert(insert_idx, make_del_element(deleted_text, author, next_id_fn(), now))
-    insert_idx += 1
-
-    parent.insert(insert_idx, make_ins_element(insert_text, author, next_id_fn(), now))
-    insert_idx += 1
-
+        inserted.append(make_text_run(before_text))
+    inserted.append(make_del_element(deleted_text, author, next_id_fn(), now))
+    if insert_text is not None:
+        inserted.append(make_ins_element(insert_text, author, next_id_fn(), now))
     if after_text:
-        parent.insert(insert_idx, make_text_run(after_text))
-        insert_idx += 1
+        inserted.append(make_text_run(after_text))
 
-    return insert_idx - index
+    for elem in inserted:
+        anchor.addprevious(elem)
+    return inserted
 
 
 def next_revision_id(element: etree._Element) -> int:
     """Generate the next unique revision ID by scanning the document tree from *element*."""
     max_id = 0
-    for ins_or_del in element.xpath("//w:ins | //w:del"):
-        id_val = ins_or_del.get(qn("w:id"))
+    for ins_or_del in DOCUMENT_REVISIONS_XPATH(element):
+        id_val = ins_or_del.get(W_ID)
         if id_val is not None:
             with contextlib.suppress(ValueError):
                 max_id = max(max_id, int(id_val))
     return max_id + 1
+
+
+def revision_id_counter(element: etree._Element) -> Callable[[], int]:
+    """Return a function yielding successive unused revision IDs for *element*'s document.
+
+    The document is scanned once, up front, so a multi-element edit does not
+    rescan it for every new ``w:ins`` / ``w:del``.
+    """
+    return itertools.count(next_revision_id(element)).__next__
@@ -8,19 +8,34 @@ when parsing ``w:ins``, ``w:del``, and related revision elements.
 from __future__ import annotations
 
 import datetime as dt
+import functools
 from typing import TYPE_CHECKING, List
 
-from docx.oxml.ns import qn
 from docx.oxml.simpletypes import ST_String, XsdInt
 from docx.oxml.text.run import CT_Text
 from docx.oxml.xmlchemy import BaseOxmlElement, OptionalAttribute, RequiredAttribute, ZeroOrMore, ZeroOrOne
 
+from docx_revisions._helpers import W_DATE, W_P, W_R, W_TBL
+
 if TYPE_CHECKING:
     from docx.oxml.table import CT_Tbl
     from docx.oxml.text.paragraph import CT_P
     from docx.oxml.text.run import CT_R
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_date(date_str: str) -> dt.datetime | None:
+    """Parse a ``w:date`` value, or return None if it is not valid ISO 8601.
+
+    Cached because a single save usually stamps many revisions with the same
+    timestamp.
+    """
+    try:
+        return dt.datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
 class CT_TrackChange(BaseOxmlElement):
     """Base class for tracked change elements.
 
@@ -39,18 +54,14 @@ class CT_TrackChange(BaseOxmlElement):
         date_str = self.date
         if date_str is None:
             return None
-        try:
-            return dt.datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except ValueError:
-            return None
+        return _parse_date(date_str)
 
     @date_value.setter
     def date_value(self, value: dt.datetime | None):
         """Set the ``w:date`` attribute from a datetime object."""
         if value is None:
-            date_qn = qn("w:date")
-            if date_qn in self.attrib:  # pyright: ignore[reportUnknownMemberType]
-                del self.attrib[date_qn]  # pyright: ignore[reportUnknownMemberType]
+            if W_DATE in self.attrib:  # pyright: ignore[reportUnknownMemberType]
+                del self.attrib[W_DATE]  # pyright: ignore[reportUnknownMemberType]
         else:
             self.date = value.strftime("%Y-%m-%dT%H:%M:%SZ")
 
@@ -73,12 +84,12 @@ class CT_RunTrackChange(CT_TrackChange):
     @property
     def inner_content_elements(self) -> List[CT_P | CT_Tbl]:
         """All ``w:p`` and ``w:tbl`` elements in this tracked change, in document order."""
-        return self.xpath("./w:p | ./w:tbl")
+        return list(self.iterchildren(W_P, W_TBL))
 
     @property
     def run_content_elements(self) -> List[CT_R]:
         """All ``w:r`` elements in this tracked change, in document order."""
-        return self.xpath("./w:r")
+        return list(self.iterchildren(W_R))
 
 
 class CT_RPrChange(CT_TrackChange):
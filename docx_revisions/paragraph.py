@@ -7,10 +7,11 @@ and deletions.
 
 from __future__ import annotations
 
+import bisect
 import datetime as dt
-from typing import TYPE_CHECKING, Iterator, List, Literal
+import itertools
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Literal
 
-from docx.oxml.ns import qn
 from docx.oxml.parser import OxmlElement
 from docx.text.hyperlink import Hyperlink
 from docx.text.paragraph import Paragraph
@@ -18,10 +19,21 @@ from docx.text.run import Run
 from lxml import etree
 
 from docx_revisions._helpers import (
-    make_del_element,
+    ACCEPTED_TEXT_XPATH,
+    ORIGINAL_TEXT_XPATH,
+    W_DEL,
+    W_DELTEXT,
+    W_HYPERLINK,
+    W_INS,
+    W_R,
+    W_RPR,
+    W_T,
+    make_ins_element,
+    make_revision_wrapper,
     make_text_run,
     next_revision_id,
-    revision_attrs,
+    revision_id_counter,
+    run_text,
     splice_tracked_replace,
 )
 from docx_revisions.revision import TrackedChange, TrackedDeletion, TrackedInsertion
@@ -32,6 +44,33 @@ if TYPE_CHECKING:
 IndexMode = Literal["text", "accepted", "original"]
 
 
+def _unit_end(boundary: tuple[int, int, int]) -> int:
+    """Sort key for binary-searching ``_text_boundaries()`` output by end offset."""
+    return boundary[2]
+
+
+# Run children a splice can rebuild from the run's text.  Before / after runs
+# are re-created from text alone, so anything else in a spanned run (tabs,
+# breaks, fields, drawings) would be lost without being tracked.
+_PLAIN_RUN_CHILDREN = frozenset({W_RPR, W_T, W_DELTEXT})
+
+
+def _is_plain_text_run(r: etree._Element) -> bool:
+    """True if run *r* holds nothing a text-only splice would drop."""
+    return all(child.tag in _PLAIN_RUN_CHILDREN for child in r)
+
+
+# Proxy class for each paragraph child tag that ``iterchildren(*tags)`` yields
+# for revisions and inner content, so callers dispatch with one dict lookup
+# per element.
+_REVISION_PROXIES: dict[str, type[TrackedChange]] = {W_INS: TrackedInsertion, W_DEL: TrackedDeletion}
+_INNER_CONTENT_PROXIES: dict[str, type[Run | Hyperlink | TrackedChange]] = {
+    W_R: Run,
+    W_HYPERLINK: Hyperlink,
+    **_REVISION_PROXIES,
+}
+
+
 class RevisionParagraph(Paragraph):
     """A ``Paragraph`` subclass that adds track-change support.
 
@@ -72,14 +111,14 @@ class RevisionParagraph(Paragraph):
     @property
     def has_track_changes(self) -> bool:
         """True if this paragraph contains any ``w:ins`` or ``w:del`` children."""
-        return bool(self._p.xpath("./w:ins | ./w:del"))
+        return next(self._p.iterchildren(W_INS, W_DEL), None) is not None
 
     @property
     def insertions(self) -> List[TrackedInsertion]:
         """All tracked insertions in this paragraph, in document order."""
         return [
             TrackedInsertion(e, self)  # pyright: ignore[reportArgumentType]
-            for e in self._p.xpath("./w:ins")
+            for e in self._p.iterchildren(W_INS)
         ]
 
     @property
@@ -87,20 +126,16 @@ class RevisionParagraph(Paragraph):
         """All tracked deletions in this paragraph, in document order."""
         return [
             TrackedDeletion(e, self)  # pyright: ignore[reportArgumentType]
-            for e in self._p.xpath("./w:del")
+            for e in self._p.iterchildren(W_DEL)
         ]
 
     @property
     def track_changes(self) -> List[TrackedChange]:
         """All tracked changes (insertions and deletions) in document order."""
-        changes: List[TrackedChange] = []
-        for e in self._p.xpath("./w:ins | ./w:del"):
-            tag = e.tag  # pyright: ignore[reportUnknownMemberType]
-            if tag == qn("w:ins"):
-                changes.append(TrackedInsertion(e, self))  # pyright: ignore[reportArgumentType]
-            elif tag == qn("w:del"):
-                changes.append(TrackedDeletion(e, self))  # pyright: ignore[reportArgumentType]
-        return changes
+        return [
+            _REVISION_PROXIES[e.tag](e, self)  # pyright: ignore[reportArgumentType]
+            for e in self._p.iterchildren(W_INS, W_DEL)
+        ]
 
     def _text_view(self, *, accept_changes: bool) -> str:
         """Return paragraph text with changes either accepted or rejected.
@@ -110,23 +145,8 @@ class RevisionParagraph(Paragraph):
                 (accepted view).  If False, include deletions and skip
                 insertions (original/rejected view).
         """
-        include_tag = qn("w:ins") if accept_changes else qn("w:del")
-        skip_tag = qn("w:del") if accept_changes else qn("w:ins")
-
-        def walk(element: etree._Element) -> str:
-            parts: List[str] = []
-            for child in element.xpath("./w:r | ./w:ins | ./w:del"):
-                tag = child.tag
-                if tag == qn("w:r"):
-                    for t in child.xpath("./w:t | ./w:delText"):
-                        parts.append(t.text or "")
-                elif tag == include_tag:
-                    parts.append(walk(child))
-                elif tag == skip_tag:
-                    continue
-            return "".join(parts)
-
-        return walk(self._p)
+        select = ACCEPTED_TEXT_XPATH if accept_changes else ORIGINAL_TEXT_XPATH
+        return "".join(select(self._p, p=self._p))
 
     @property
     def accepted_text(self) -> str:
@@ -162,21 +182,10 @@ class RevisionParagraph(Paragraph):
             ``Run``, ``Hyperlink``, ``TrackedInsertion``, or ``TrackedDeletion``
             objects in document order.
         """
-        if include_revisions:
-            elements = self._p.xpath("./w:r | ./w:hyperlink | ./w:ins | ./w:del")
-        else:
-            elements = self._p.xpath("./w:r | ./w:hyperlink")
-
-        for element in elements:
-            tag = element.tag  # pyright: ignore[reportUnknownMemberType]
-            if tag == qn("w:r"):
-                yield Run(element, self)
-            elif tag == qn("w:hyperlink"):
-                yield Hyperlink(element, self)  # pyright: ignore[reportArgumentType]
-            elif tag == qn("w:ins"):
-                yield TrackedInsertion(element, self)  # pyright: ignore[reportArgumentType]
-            elif tag == qn("w:del"):
-                yield TrackedDeletion(element, self)  # pyright: ignore[reportArgumentType]
+        tags = (W_R, W_HYPERLINK, W_INS, W_DEL) if include_revisions else (W_R, W_HYPERLINK)
+
+        for element in self._p.iterchildren(*tags):
+            yield _INNER_CONTENT_PROXIES[element.tag](element, self)  # pyright: ignore[reportArgumentType]
 
     # ------------------------------------------------------------------
     # Write operations
@@ -214,9 +223,8 @@ class RevisionParagraph(Paragraph):
         if revision_id is None:
             revision_id = self._next_revision_id()
 
-        ins = OxmlElement(
-            "w:ins",
-            attrs=revision_attrs(revision_id, author, dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")),
+        ins = make_revision_wrapper(
+            "w:ins", author, revision_id, dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         )
 
         r = OxmlElement("w:r")
@@ -247,18 +255,17 @@ class RevisionParagraph(Paragraph):
             author: Author name for the revision.
             revision_id: Unique ID for this revision.  Auto-generated if not
                 provided.
-            index_mode: Which text view the offsets index into:
-                ``"text"`` (default, raw ``paragraph.text`` ignoring prior
-                revisions), ``"accepted"`` (``paragraph.accepted_text``, with
-                prior insertions kept and deletions skipped), or
-                ``"original"`` (``paragraph.original_text``, with prior
-                deletions kept and insertions skipped).
+            index_mode: Which text view the offsets index into.  See
+                :meth:`replace_tracked`; as there, offsets count only the run
+                text that is spliced, so in ``"text"`` mode tabs and breaks
+                take up no offsets.
 
         Returns:
             A ``TrackedDeletion`` wrapping the new ``w:del`` element.
 
         Raises:
-            ValueError: If offsets are invalid.
+            ValueError: If offsets are invalid, or the span crosses a revision
+                boundary or non-text run content.
 
         Example:
             ```python
@@ -266,74 +273,20 @@ class RevisionParagraph(Paragraph):
             rp.add_tracked_deletion(0, 5, author="Editor", index_mode="accepted")
             ```
         """
-        view_text = self._view_text(index_mode)
-        if start < 0 or end > len(view_text) or start >= end:
-            raise ValueError(f"Invalid offsets: start={start}, end={end} for text of length {len(view_text)}")
+        units = self._get_editable_units(index_mode)
+        texts = [run_text(r) for r in units]
+        full_text = "".join(texts)
+        if start < 0 or end > len(full_text) or start >= end:
+            raise ValueError(f"Invalid offsets: start={start}, end={end} for text of length {len(full_text)}")
+        boundaries = self._text_boundaries(texts)
 
         if revision_id is None:
             revision_id = self._next_revision_id()
 
-        units = self._get_editable_units(index_mode)
-        if not units:
-            raise ValueError("Paragraph has no runs")
-        boundaries = self._unit_boundaries(units)
-
-        start_unit_idx, start_offset = self._find_unit_at_offset(boundaries, start)
-        end_unit_idx, end_offset = self._find_unit_at_offset(boundaries, end)
-
-        # All units in the [start, end) span must share the same parent for a
-        # clean single-parent splice.  This holds when the span is entirely in
-        # top-level w:r runs, or entirely inside one w:ins / w:del wrapper.
-        start_parent = units[start_unit_idx].getparent()
-        end_parent = units[end_unit_idx].getparent()
-        if start_parent is None or start_parent is not end_parent:
-            raise ValueError(
-                "Cannot apply tracked deletion across a revision boundary; "
-                "operate on a narrower span entirely inside or outside a prior revision."
-            )
-        parent = start_parent
-
         now = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        def _r_text(r: etree._Element) -> str:
-            parts = []
-            for child in r.xpath("./w:t | ./w:delText"):
-                parts.append(child.text or "")
-            return "".join(parts)
-
-        # Collect the deleted text
-        deleted_text_parts: List[str] = []
-        if start_unit_idx == end_unit_idx:
-            deleted_text_parts.append(_r_text(units[start_unit_idx])[start_offset:end_offset])
-        else:
-            deleted_text_parts.append(_r_text(units[start_unit_idx])[start_offset:])
-            for i in range(start_unit_idx + 1, end_unit_idx):
-                deleted_text_parts.append(_r_text(units[i]))
-            deleted_text_parts.append(_r_text(units[end_unit_idx])[:end_offset])
-        deleted_text = "".join(deleted_text_parts)
-
-        start_r = units[start_unit_idx]
-        before_text = _r_text(start_r)[:start_offset]
-        after_text = _r_text(units[end_unit_idx])[end_offset:]
-
-        index = list(parent).index(start_r)
-        for i in range(start_unit_idx, end_unit_idx + 1):
-            run_elem = units[i]
-            if run_elem.getparent() is parent:
-                parent.remove(run_elem)
-
-        insert_idx = index
-
-        if before_text:
-            parent.insert(insert_idx, make_text_run(before_text))
-            insert_idx += 1
-
-        del_elem = make_del_element(deleted_text, author, revision_id, now)
-        parent.insert(insert_idx, del_elem)
-        insert_idx += 1
-
-        if after_text:
-            parent.insert(insert_idx, make_text_run(after_text))
+        rev_id = revision_id
+        inserted = self._splice_replace(units, texts, boundaries, start, end, None, author, lambda: rev_id, now)
+        del_elem = next(e for e in inserted if e.tag == W_DEL)
 
         return TrackedDeletion(del_elem, self)  # pyright: ignore[reportArgumentType]
 
@@ -358,18 +311,24 @@ class RevisionParagraph(Paragraph):
             comment: Optional comment text (requires python-docx comment
                 support).
             index_mode: Which text view to search against:
-                ``"text"`` (default, raw ``paragraph.text``),
+                ``"text"`` (default, the ``w:t`` / ``w:delText`` text of
+                top-level runs only; unlike ``paragraph.text`` this leaves
+                out tabs, breaks, hyperlink text and prior revisions),
                 ``"accepted"`` (``paragraph.accepted_text``, includes prior
                 insertions, skips prior deletions), or ``"original"``
                 (``paragraph.original_text``, includes prior deletions, skips
                 prior insertions).
 
         Returns:
-            The number of replacements made.
+            The number of replacements made.  This is 0, and the paragraph is
+            left untouched, when *search_text* is empty or equal to
+            *replace_text*.  Matches that cross a revision boundary are
+            skipped rather than raising, and every match is checked before
+            the first splice, so the paragraph is never left half-edited.
 
         Example:
             ```python
-            # Default: search raw run text
+            # Default: search the text of top-level runs
             rp.replace_tracked("old", "new", author="Editor")
 
             # Search the accepted view — matches land inside prior w:ins blocks
@@ -378,8 +337,12 @@ class RevisionParagraph(Paragraph):
             )
             ```
         """
-        count = 0
-        full_text = self._view_text(index_mode)
+        if not search_text or search_text == replace_text:
+            return 0
+
+        units = self._get_editable_units(index_mode)
+        texts = [run_text(r) for r in units]
+        full_text = "".join(texts)
         search_len = len(search_text)
 
         # Find all match positions in the concatenated text.
@@ -393,14 +356,21 @@ class RevisionParagraph(Paragraph):
             positions.append(idx)
             start = idx + search_len
 
-        # Apply replacements right-to-left to preserve offsets.
+        boundaries = self._text_boundaries(texts)
+        positions = [pos for pos in positions if self._spliceable_span(units, boundaries, pos, pos + search_len)]
+        if not positions:
+            return 0
+
+        # Apply replacements right-to-left to preserve offsets.  The unit
+        # list is read once and trimmed after each splice, so every match is
+        # handled without walking the paragraph again.
+        now = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        next_id = revision_id_counter(self._p)
         for pos in reversed(positions):
-            self.replace_tracked_at(
-                pos, pos + search_len, replace_text, author=author, comment=comment, index_mode=index_mode
-            )
-            count += 1
+            end = pos + search_len
+            self._splice_replace(units, texts, boundaries, pos, end, replace_text, author, next_id, now)
 
-        return count
+        return len(positions)
 
     def replace_tracked_at(
         self,
@@ -414,7 +384,13 @@ class RevisionParagraph(Paragraph):
         """Replace text at character offsets *[start, end)* using track changes.
 
         Creates a tracked deletion of the text at positions ``[start, end)``
-        and a tracked insertion of *replace_text* at that position.
+        and a tracked insertion of *replace_text* at that position.  Nothing
+        is changed if that text already equals *replace_text*.
+
+        Offsets are bounds-checked and compared against the same run text
+        that is spliced, i.e. the text :meth:`replace_tracked` searches for
+        *index_mode*, so in ``"text"`` mode tabs and breaks take up no
+        offsets even though ``paragraph.text`` renders them.
 
         Args:
             start: Starting character offset (0-based, inclusive).
@@ -437,57 +413,197 @@ class RevisionParagraph(Paragraph):
             )
             ```
         """
-        view_text = self._view_text(index_mode)
-        if start < 0 or end > len(view_text) or start >= end:
-            raise ValueError(f"Invalid offsets: start={start}, end={end} for text of length {len(view_text)}")
+        units = self._get_editable_units(index_mode)
+        texts = [run_text(r) for r in units]
+        full_text = "".join(texts)
+        if start < 0 or end > len(full_text) or start >= end:
+            raise ValueError(f"Invalid offsets: start={start}, end={end} for text of length {len(full_text)}")
+        if full_text[start:end] == replace_text:
+            return
+        boundaries = self._text_boundaries(texts)
+
+        now = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._splice_replace(
+            units, texts, boundaries, start, end, replace_text, author, revision_id_counter(self._p), now
+        )
+
+    def apply_tracked_edits(
+        self, edits: Iterable[tuple[int, int, str]], author: str = "", index_mode: IndexMode = "text"
+    ) -> int:
+        """Apply a batch of tracked edits given as *(start, end, text)* offsets.
+
+        All offsets refer to the paragraph as it is before any edit is made.
+        An edit with ``start == end`` inserts *text* at that offset, an empty
+        *text* deletes *[start, end)*, and anything else replaces it.  The
+        paragraph is read once and the edits are spliced right-to-left, so a
+        batch costs far less than the equivalent sequence of single calls.
+        Insertions at the same offset keep their order in *edits*, and a span
+        whose text already equals *text* is left alone.
 
+        Args:
+            edits: The ``(start, end, text)`` edits to apply, in any order.
+            author: Author name for the revisions.
+            index_mode: Which text view the offsets index into.  See
+                :meth:`replace_tracked`.
+
+        Returns:
+            The number of edits applied.
+
+        Raises:
+            ValueError: If any offsets are invalid, an insertion is empty, two
+                edits overlap, a span crosses a revision boundary or non-text
+                run content, or an insertion would split a run holding tabs,
+                breaks or other non-text content.  Nothing is changed when an
+                error is raised.
+
+        Example:
+            ```python
+            # "The quick fox" -> "The slow brown fox"
+            rp.apply_tracked_edits(
+                [(4, 9, "slow"), (10, 10, "brown ")], author="Editor"
+            )
+            ```
+        """
         units = self._get_editable_units(index_mode)
-        if not units:
-            raise ValueError("Paragraph has no runs")
-        boundaries = self._unit_boundaries(units)
+        texts = [run_text(r) for r in units]
+        boundaries = self._text_boundaries(texts)
+        full_text = "".join(texts)
+
+        ordered = sorted(enumerate(edits), key=lambda item: (item[1][0], item[1][1], item[0]))
+        pending: List[tuple[int, int, str]] = []
+        prev_end = 0
+        for _, (start, end, text) in ordered:
+            if start < 0 or end > len(full_text) or start > end or (start == end and not text):
+                raise ValueError(f"Invalid offsets: start={start}, end={end} for text of length {len(full_text)}")
+            if start < prev_end:
+                raise ValueError(f"Overlapping tracked edits at start={start}, end={end}")
+            prev_end = end
+            if start == end:
+                if units:
+                    unit_idx, offset_in_unit = self._find_unit_ending_at(boundaries, start)
+                    if 0 < offset_in_unit < len(texts[unit_idx]) and not _is_plain_text_run(units[unit_idx]):
+                        raise ValueError(
+                            f"Cannot apply tracked insertion at {start} inside a run with non-text content; "
+                            "insert at one of the run's edges instead."
+                        )
+                pending.append((start, end, text))
+            elif full_text[start:end] != text:
+                action = "replacement" if text else "deletion"
+                self._span_parent(units, boundaries, start, end, action)
+                pending.append((start, end, text))
+
+        if not pending:
+            return 0
 
-        start_unit_idx, start_offset_in_unit = self._find_unit_at_offset(boundaries, start)
-        end_unit_idx, end_offset_in_unit = self._find_unit_at_offset(boundaries, end)
+        now = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        next_id = revision_id_counter(self._p)
+        anchor: etree._Element | None = None
+        for start, end, text in reversed(pending):
+            if start == end:
+                inserted = self._splice_insert(units, texts, boundaries, start, text, author, next_id, now, anchor)
+            else:
+                inserted = self._splice_replace(
+                    units, texts, boundaries, start, end, text or None, author, next_id, now
+                )
+            anchor = inserted[0]
+
+        return len(pending)
 
-        start_parent = units[start_unit_idx].getparent()
-        end_parent = units[end_unit_idx].getparent()
-        if start_parent is None or start_parent is not end_parent:
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _next_revision_id(self) -> int:
+        """Generate the next unique revision ID for this document."""
+        return next_revision_id(self._p)
+
+    def _spliceable_span(
+        self, units: List[etree._Element], boundaries: List[tuple[int, int, int]], start: int, end: int
+    ) -> bool:
+        """True if the units spanning *[start, end)* can be spliced as one block.
+
+        The spanned units must be consecutive siblings, so the span is
+        entirely in top-level ``w:r`` runs or entirely inside one ``w:ins`` /
+        ``w:del`` wrapper, with no prior revision, hyperlink or other element
+        between them.  Each spanned unit must also be a plain text run (see
+        ``_is_plain_text_run()``), because the splice rebuilds the runs it
+        keeps from their text alone.
+        """
+        start_unit_idx, _ = self._find_unit_at_offset(boundaries, start)
+        end_unit_idx, _ = self._find_unit_ending_at(boundaries, end)
+        spanned = units[start_unit_idx : end_unit_idx + 1]
+        if not all(_is_plain_text_run(r) for r in spanned):
+            return False
+        return all(r.getnext() is following for r, following in itertools.pairwise(spanned))
+
+    def _span_parent(
+        self, units: List[etree._Element], boundaries: List[tuple[int, int, int]], start: int, end: int, action: str
+    ) -> etree._Element:
+        """Return the parent shared by every unit in the *[start, end)* span.
+
+        Raises:
+            ValueError: If the span crosses a revision boundary or covers
+                non-text run content; see :meth:`_spliceable_span`.
+        """
+        start_unit_idx, _ = self._find_unit_at_offset(boundaries, start)
+        parent = units[start_unit_idx].getparent()
+        if parent is None or not self._spliceable_span(units, boundaries, start, end):
             raise ValueError(
-                "Cannot apply tracked replacement across a revision boundary; "
-                "operate on a narrower span entirely inside or outside a prior revision."
+                f"Cannot apply tracked {action} across a revision boundary or non-text run content; "
+                "operate on a narrower span of plain text entirely inside or outside a prior revision."
             )
-        parent = start_parent
+        return parent
 
-        now = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    def _splice_replace(
+        self,
+        units: List[etree._Element],
+        texts: List[str],
+        boundaries: List[tuple[int, int, int]],
+        start: int,
+        end: int,
+        replace_text: str | None,
+        author: str,
+        next_id_fn: Callable[[], int],
+        now: str,
+    ) -> List[etree._Element]:
+        """Replace *[start, end)* of the unit view with a tracked deletion and insertion.
+
+        With *replace_text* None only the tracked deletion is made.  *units*,
+        *texts* and *boundaries* are updated in place so that they still
+        describe the paragraph text before *start*, which lets callers apply
+        successive right-to-left splices from a single read of the paragraph.
 
-        def _r_text(r: etree._Element) -> str:
-            parts = []
-            for child in r.xpath("./w:t | ./w:delText"):
-                parts.append(child.text or "")
-            return "".join(parts)
+        Returns:
+            The inserted elements, in document order.
+        """
+        action = "deletion" if replace_text is None else "replacement"
+        parent = self._span_parent(units, boundaries, start, end, action)
+        start_unit_idx, start_offset_in_unit = self._find_unit_at_offset(boundaries, start)
+        end_unit_idx, end_offset_in_unit = self._find_unit_ending_at(boundaries, end)
 
         if start_unit_idx == end_unit_idx:
             r = units[start_unit_idx]
-            text = _r_text(r)
+            text = texts[start_unit_idx]
             before_text = text[:start_offset_in_unit] or None
             deleted_text = text[start_offset_in_unit:end_offset_in_unit]
             after_text = text[end_offset_in_unit:] or None
             first_r = r
         else:
             first_r = units[start_unit_idx]
-            start_text = _r_text(first_r)
+            start_text = texts[start_unit_idx]
             before_text = start_text[:start_offset_in_unit] or None
             deleted_from_start = start_text[start_offset_in_unit:]
 
-            end_r = units[end_unit_idx]
-            end_text = _r_text(end_r)
+            end_text = texts[end_unit_idx]
             deleted_from_end = end_text[:end_offset_in_unit]
             after_text = end_text[end_offset_in_unit:] or None
 
-            middle_deleted = "".join(_r_text(units[i]) for i in range(start_unit_idx + 1, end_unit_idx))
+            middle_deleted = "".join(texts[start_unit_idx + 1 : end_unit_idx])
             deleted_text = deleted_from_start + middle_deleted + deleted_from_end
 
-        index = list(parent).index(first_r)
+        inserted = splice_tracked_replace(
+            first_r, before_text, deleted_text, replace_text, after_text, author, next_id_fn, now
+        )
 
         # Remove spanned runs (only if they share the parent, which the check above guarantees)
         for i in range(start_unit_idx, end_unit_idx + 1):
@@ -495,27 +611,84 @@ class RevisionParagraph(Paragraph):
             if run_elem.getparent() is parent:
                 parent.remove(run_elem)
 
-        splice_tracked_replace(
-            parent, index, before_text, deleted_text, replace_text, after_text, author, self._next_revision_id, now
-        )
+        self._trim_units(units, texts, boundaries, start_unit_idx, inserted[0] if before_text else None, before_text)
+        return inserted
 
-    # ------------------------------------------------------------------
-    # Private helpers
-    # ------------------------------------------------------------------
+    def _splice_insert(
+        self,
+        units: List[etree._Element],
+        texts: List[str],
+        boundaries: List[tuple[int, int, int]],
+        offset: int,
+        insert_text: str,
+        author: str,
+        next_id_fn: Callable[[], int],
+        now: str,
+        anchor: etree._Element | None,
+    ) -> List[etree._Element]:
+        """Insert *insert_text* as a tracked insertion at *offset* of the unit view.
+
+        A run is split only when *offset* falls strictly inside it.  When no
+        units remain (an empty paragraph, or a previous splice that started at
+        offset 0), the insertion goes before *anchor*, or at the end of the
+        paragraph if *anchor* is None.  *units*, *texts* and *boundaries* are
+        trimmed as in :meth:`_splice_replace`.
 
-    def _next_revision_id(self) -> int:
-        """Generate the next unique revision ID for this document."""
-        return next_revision_id(self._p)
+        Returns:
+            The inserted elements, in document order.
+        """
+        ins_elem = make_ins_element(insert_text, author, next_id_fn(), now)
+        if not units:
+            if anchor is None:
+                self._p.append(ins_elem)  # pyright: ignore[reportUnknownMemberType]
+            else:
+                anchor.addprevious(ins_elem)
+            return [ins_elem]
+
+        unit_idx, offset_in_unit = self._find_unit_ending_at(boundaries, offset)
+        r = units[unit_idx]
+        text = texts[unit_idx]
+        if offset_in_unit >= len(text) and text:
+            r.addnext(ins_elem)
+            self._trim_units(units, texts, boundaries, unit_idx + 1, None, None)
+            return [ins_elem]
+        if offset_in_unit == 0:
+            r.addprevious(ins_elem)
+            self._trim_units(units, texts, boundaries, unit_idx, None, None)
+            return [ins_elem]
+
+        before_text = text[:offset_in_unit]
+        inserted = [make_text_run(before_text), ins_elem, make_text_run(text[offset_in_unit:])]
+        for elem in inserted:
+            r.addprevious(elem)
+        parent = r.getparent()
+        if parent is not None:
+            parent.remove(r)
+        self._trim_units(units, texts, boundaries, unit_idx, inserted[0], before_text)
+        return inserted
 
-    def _view_text(self, index_mode: IndexMode) -> str:
-        """Return the paragraph text for the chosen index mode."""
-        if index_mode == "text":
-            return self.text
-        if index_mode == "accepted":
-            return self.accepted_text
-        if index_mode == "original":
-            return self.original_text
-        raise ValueError(f"Unknown index_mode: {index_mode!r}")
+    @staticmethod
+    def _trim_units(
+        units: List[etree._Element],
+        texts: List[str],
+        boundaries: List[tuple[int, int, int]],
+        unit_idx: int,
+        before_run: etree._Element | None,
+        before_text: str | None,
+    ) -> None:
+        """Drop the now-stale units from *unit_idx* onwards after a splice.
+
+        Only the re-created *before_run*, if any, is kept so that a further
+        splice to the left can still land in it.
+        """
+        unit_start = boundaries[unit_idx][1] if unit_idx < len(boundaries) else 0
+        del units[unit_idx:]
+        del texts[unit_idx:]
+        del boundaries[unit_idx:]
+        if before_run is not None and before_text:
+            units.append(before_run)
+            texts.append(before_text)
+            boundaries.append((unit_idx, unit_start, unit_start + len(before_text)))
 
     def _get_editable_units(self, index_mode: IndexMode) -> List[etree._Element]:
         """Return the ordered list of ``w:r`` elements that make up *index_mode*'s view.
@@ -527,23 +700,23 @@ class RevisionParagraph(Paragraph):
           (prior deletions visible), skip ``w:ins``.
         """
         if index_mode == "text":
-            return list(self._p.xpath("./w:r"))
+            return list(self._p.iterchildren(W_R))
 
         if index_mode == "accepted":
-            recurse_tag = qn("w:ins")
-            skip_tag = qn("w:del")
+            recurse_tag = W_INS
+            skip_tag = W_DEL
         elif index_mode == "original":
-            recurse_tag = qn("w:del")
-            skip_tag = qn("w:ins")
+            recurse_tag = W_DEL
+            skip_tag = W_INS
         else:
             raise ValueError(f"Unknown index_mode: {index_mode!r}")
 
         units: List[etree._Element] = []
 
         def walk(element: etree._Element) -> None:
-            for child in element.xpath("./w:r | ./w:ins | ./w:del"):
+            for child in element.iterchildren(W_R, W_INS, W_DEL):
                 tag = child.tag
-                if tag == qn("w:r"):
+                if tag == W_R:
                     units.append(child)
                 elif tag == recurse_tag:
                     walk(child)
@@ -556,25 +729,49 @@ class RevisionParagraph(Paragraph):
     @staticmethod
     def _unit_boundaries(units: List[etree._Element]) -> List[tuple[int, int, int]]:
         """Return ``(unit_index, start_offset, end_offset)`` for each unit."""
+        return RevisionParagraph._text_boundaries([run_text(r) for r in units])
+
+    @staticmethod
+    def _text_boundaries(texts: List[str]) -> List[tuple[int, int, int]]:
+        """Like :meth:`_unit_boundaries`, but from each unit's already-read text.
+
+        Args:
+            texts: The text of each unit, as returned by ``run_text()``, so
+                callers that also need the text only read each run once.
+        """
         boundaries: List[tuple[int, int, int]] = []
         offset = 0
-        for i, r in enumerate(units):
-            # Sum text from both w:t and w:delText direct children
-            run_len = 0
-            for child in r.xpath("./w:t | ./w:delText"):
-                run_len += len(child.text or "")
+        for i, text in enumerate(texts):
+            run_len = len(text)
             boundaries.append((i, offset, offset + run_len))
             offset += run_len
         return boundaries
 
     @staticmethod
     def _find_unit_at_offset(boundaries: List[tuple[int, int, int]], offset: int) -> tuple[int, int]:
-        """Find which unit contains *offset* and the offset within that unit."""
-        for unit_idx, unit_start, unit_end in boundaries:
-            if unit_start <= offset < unit_end or (offset == unit_end and unit_idx == len(boundaries) - 1):
-                return unit_idx, offset - unit_start
-        last_idx, last_start, _ = boundaries[-1]
-        return last_idx, offset - last_start
+        """Find which unit contains *offset* and the offset within that unit.
+
+        An offset on a unit boundary resolves to the unit starting there; an
+        offset at or past the end resolves to the last unit.  Boundaries are
+        binary-searched on their cumulative end offsets, so units before
+        *offset* are never visited.
+        """
+        i = min(bisect.bisect_right(boundaries, offset, key=_unit_end), len(boundaries) - 1)
+        unit_idx, unit_start, _ = boundaries[i]
+        return unit_idx, offset - unit_start
+
+    @staticmethod
+    def _find_unit_ending_at(boundaries: List[tuple[int, int, int]], offset: int) -> tuple[int, int]:
+        """Like :meth:`_find_unit_at_offset`, but for the exclusive end of a span.
+
+        An offset on a unit boundary resolves to the unit ending there, so a
+        span that stops exactly at a run's end leaves the following run alone
+        — it is neither re-created as an "after" run nor checked against the
+        span's revision boundary.
+        """
+        i = min(bisect.bisect_left(boundaries, offset, key=_unit_end), len(boundaries) - 1)
+        unit_idx, unit_start, _ = boundaries[i]
+        return unit_idx, offset - unit_start
 
     # Back-compat aliases (used by older external code or tests that may import them)
     def _get_run_boundaries(self) -> List[tuple[int, int, int]]:
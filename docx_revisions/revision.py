@@ -11,9 +11,10 @@ from __future__ import annotations
 import datetime as dt
 from typing import TYPE_CHECKING, Iterator, List
 
-from docx.oxml.ns import qn
 from docx.shared import Parented
 
+from docx_revisions._helpers import DEL_TEXT_XPATH, W_P, W_T, W_TBL
+
 if TYPE_CHECKING:
     import docx.types as t
     from docx.table import Table
@@ -81,9 +82,9 @@ class TrackedChange(Parented):
 
         for element in self._element.inner_content_elements:
             tag = element.tag  # pyright: ignore[reportUnknownMemberType]
-            if tag == qn("w:p"):
+            if tag == W_P:
                 yield Paragraph(element, self._parent)  # pyright: ignore[reportArgumentType]
-            elif tag == qn("w:tbl"):
+            elif tag == W_TBL:
                 yield Table(element, self._parent)  # pyright: ignore[reportArgumentType]
 
     def iter_runs(self) -> Iterator[Run]:
@@ -155,9 +156,8 @@ class TrackedInsertion(TrackedChange):
         if parent is None:
             return
 
-        index = list(parent).index(self._element)
-        for child in reversed(list(self._element)):
-            parent.insert(index, child)
+        for child in list(self._element):
+            self._element.addprevious(child)
 
         parent.remove(self._element)
 
@@ -187,7 +187,7 @@ class TrackedDeletion(TrackedChange):
         if self.is_block_level:
             return "\n".join(p.text for p in self.paragraphs)
         # w:del runs use w:delText instead of w:t, so we need xpath
-        del_texts = self._element.xpath(".//w:delText")
+        del_texts = DEL_TEXT_XPATH(self._element)
         if del_texts:
             return "".join(t.text or "" for t in del_texts)
         # Fallback: try normal run text (for cases where w:t is still used)
@@ -209,21 +209,13 @@ class TrackedDeletion(TrackedChange):
         if parent is None:
             return
 
-        # Convert w:delText back to w:t before unwrapping
-        for del_text in self._element.xpath(".//w:delText"):
-            from docx.oxml.parser import OxmlElement
-
-            t_elem = OxmlElement("w:t")
-            t_elem.text = del_text.text
-            space_val = del_text.get(qn("xml:space"))
-            if space_val:
-                t_elem.set(qn("xml:space"), space_val)
-            del_text_parent = del_text.getparent()
-            if del_text_parent is not None:
-                del_text_parent.replace(del_text, t_elem)
-
-        index = list(parent).index(self._element)
-        for child in reversed(list(self._element)):
-            parent.insert(index, child)
+        # Convert w:delText back to w:t before unwrapping.  Renaming in place
+        # keeps the text and any xml:space setting without building and
+        # splicing in a replacement node; both tags map to ``CT_Text``.
+        for del_text in DEL_TEXT_XPATH(self._element):
+            del_text.tag = W_T
+
+        for child in list(self._element):
+            self._element.addprevious(child)
 
         parent.remove(self._element)
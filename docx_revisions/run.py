@@ -8,11 +8,16 @@ from __future__ import annotations
 
 import datetime as dt
 
-from docx.oxml.ns import qn
-from docx.oxml.parser import OxmlElement
 from docx.text.run import Run
 
-from docx_revisions._helpers import next_revision_id, revision_attrs, splice_tracked_replace
+from docx_revisions._helpers import (
+    W_DELTEXT,
+    W_T,
+    make_revision_wrapper,
+    next_revision_id,
+    revision_id_counter,
+    splice_tracked_replace,
+)
 from docx_revisions.revision import TrackedDeletion
 
 
@@ -70,20 +75,16 @@ class RevisionRun(Run):
         if parent is None:
             raise ValueError("Run has no parent element")
 
-        del_elem = OxmlElement(
-            "w:del",
-            attrs=revision_attrs(revision_id, author, dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")),
+        del_elem = make_revision_wrapper(
+            "w:del", author, revision_id, dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         )
 
-        for t_elem in self._r.findall(qn("w:t")):
-            delText = OxmlElement("w:delText")
-            delText.text = t_elem.text
-            if t_elem.get(qn("xml:space")) == "preserve":
-                delText.set(qn("xml:space"), "preserve")
-            t_elem.getparent().replace(t_elem, delText)  # pyright: ignore[reportOptionalMemberAccess]
+        # Rename in place: the text and every attribute (xml:space included)
+        # carry over without copying them one by one onto a new element.
+        for t_elem in self._r.iterchildren(W_T):
+            t_elem.tag = W_DELTEXT
 
-        index = list(parent).index(self._r)
-        parent.insert(index, del_elem)
+        self._r.addprevious(del_elem)
         del_elem.append(self._r)
 
         return TrackedDeletion(del_elem, self._parent)  # pyright: ignore[reportArgumentType]
@@ -117,12 +118,10 @@ class RevisionRun(Run):
         if parent is None:
             raise ValueError("Run has no parent element")
 
-        index = list(parent).index(r_elem)
-        parent.remove(r_elem)
-
         splice_tracked_replace(
-            parent, index, before_text, deleted_text, replace_text, after_text, author, self._next_revision_id, now
+            r_elem, before_text, deleted_text, replace_text, after_text, author, revision_id_counter(self._r), now
         )
+        parent.remove(r_elem)
 
     def _next_revision_id(self) -> int:
         """Generate the next unique revision ID for this document."""
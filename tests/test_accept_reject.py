@@ -3,9 +3,10 @@
 from pathlib import Path
 
 from docx import Document
+from docx.oxml.ns import qn
 
 import docx_revisions  # noqa: F401
-from docx_revisions import RevisionDocument, RevisionParagraph
+from docx_revisions import RevisionDocument, RevisionParagraph, RevisionRun
 
 
 class DescribeAcceptReject_individual:
@@ -57,6 +58,20 @@ class DescribeAcceptReject_individual:
         # After rejecting deletion, "Hello" should be restored as normal text
         assert "Hello" in rp.text
 
+    def it_rejecting_a_deletion_keeps_space_preservation(self):
+        doc = Document()
+        para = doc.add_paragraph("")
+        para.add_run(" padded ")
+        rp = RevisionParagraph.from_paragraph(para)
+        tracked = RevisionRun.from_run(para.runs[0]).delete_tracked(author="A")
+
+        tracked.reject()
+
+        (t,) = rp._p.xpath("./w:r/w:t")
+        assert t.text == " padded "
+        assert t.get(qn("xml:space")) == "preserve"
+        assert rp.text == " padded "
+
 
 class DescribeAcceptReject_document_level:
     """Accept/reject all changes in a document."""
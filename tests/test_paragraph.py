@@ -4,6 +4,8 @@ from pathlib import Path
 
 import pytest
 from docx import Document
+from docx.oxml.ns import nsdecls
+from docx.oxml.parser import parse_xml
 
 import docx_revisions  # noqa: F401
 from docx_revisions import RevisionParagraph
@@ -95,6 +97,24 @@ class DescribeRevisionParagraph_reading:
         # Para 4 has del(colour) then ins(color) in document order
         assert len(changes) == 2
 
+    def it_reads_views_through_nested_revisions_only(self):
+        p = parse_xml(
+            f"<w:p {nsdecls('w')}>"
+            "<w:r><w:t>a</w:t></w:r>"
+            '<w:ins w:id="1" w:author="A">'
+            "<w:r><w:t>b</w:t></w:r>"
+            '<w:del w:id="2" w:author="A"><w:r><w:delText>c</w:delText></w:r></w:del>'
+            '<w:ins w:id="3" w:author="A"><w:r><w:t>d</w:t></w:r></w:ins>'
+            "</w:ins>"
+            '<w:del w:id="4" w:author="A"><w:r><w:delText>e</w:delText></w:r></w:del>'
+            "<w:hyperlink><w:r><w:t>f</w:t></w:r></w:hyperlink>"
+            "</w:p>"
+        )
+        rp = RevisionParagraph(p, None)  # pyright: ignore[reportArgumentType]
+
+        assert rp.accepted_text == "abd"
+        assert rp.original_text == "ae"
+
 
 # -- Writing ---------------------------------------------------------------
 
@@ -143,6 +163,19 @@ class DescribeRevisionParagraph_writing:
         with pytest.raises(ValueError, match="Invalid offsets"):
             rp.add_tracked_deletion(start=10, end=15, author="A")
 
+    def it_checks_deletion_offsets_against_the_run_text_it_splices(self):
+        doc = Document()
+        para = doc.add_paragraph("a")
+        para.add_run("\t")
+        para.add_run("bc")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        with pytest.raises(ValueError, match="Invalid offsets"):
+            rp.add_tracked_deletion(start=3, end=4, author="A")
+        assert rp.has_track_changes is False
+
+        assert rp.add_tracked_deletion(start=2, end=3, author="A").text == "c"
+
     def it_sets_date_on_insertion(self):
         doc = Document()
         para = doc.add_paragraph("Text")
@@ -151,6 +184,17 @@ class DescribeRevisionParagraph_writing:
         tracked = rp.add_tracked_insertion(text="new", author="A")
         assert tracked.date is not None
 
+    def it_measures_unit_boundaries_from_run_elements(self):
+        doc = Document()
+        para = doc.add_paragraph("Hello")
+        para.add_run(" World")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        units = rp._get_editable_units("text")
+
+        assert rp._unit_boundaries(units) == [(0, 0, 5), (1, 5, 11)]
+        assert rp._get_run_boundaries() == [(0, 0, 5), (1, 5, 11)]
+
 
 # -- iter_inner_content ----------------------------------------------------
 
@@ -1,7 +1,10 @@
-"""Tests for replace_tracked and replace_tracked_at."""
+"""Tests for replace_tracked, replace_tracked_at and apply_tracked_edits."""
 
 import pytest
 from docx import Document
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml.parser import parse_xml
+from lxml import etree
 
 import docx_revisions  # noqa: F401
 from docx_revisions import RevisionDocument, RevisionParagraph
@@ -45,6 +48,39 @@ class DescribeRevisionParagraph_replace_tracked:
         assert count == 0
         assert rp.has_track_changes is False
 
+    def it_returns_zero_for_empty_search_text(self):
+        doc = Document()
+        para = doc.add_paragraph("Some text")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        count = rp.replace_tracked("", "x", author="Tester")
+
+        assert count == 0
+        assert rp.has_track_changes is False
+
+    def it_preserves_edge_whitespace_in_tracked_text(self):
+        doc = Document()
+        para = doc.add_paragraph("Hello World")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        rp.replace_tracked(" World", " Earth ", author="Tester")
+
+        (del_text,) = rp._p.xpath("./w:del/w:r/w:delText")
+        (ins_text,) = rp._p.xpath("./w:ins/w:r/w:t")
+        assert del_text.get(qn("xml:space")) == "preserve"
+        assert ins_text.get(qn("xml:space")) == "preserve"
+        assert rp._p.xpath("./w:r/w:t")[0].get(qn("xml:space")) is None
+
+    def it_leaves_identical_replacements_untracked(self):
+        doc = Document()
+        para = doc.add_paragraph("Unisys and Unisys")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        count = rp.replace_tracked("Unisys", "Unisys", author="Tester")
+
+        assert count == 0
+        assert rp.has_track_changes is False
+
     def it_preserves_surrounding_text(self):
         doc = Document()
         para = doc.add_paragraph("Before Unisys After")
@@ -117,6 +153,91 @@ class DescribeRevisionParagraph_replace_tracked:
         assert len(rp.deletions) == 2
         assert len(rp.insertions) == 2
 
+    def it_assigns_unique_revision_ids_across_matches(self):
+        doc = Document()
+        para = doc.add_paragraph("Unisys and Unisys again")
+        rp = RevisionParagraph.from_paragraph(para)
+        rp.add_tracked_insertion(" end", author="Prior", revision_id=7)
+
+        rp.replace_tracked("Unisys", "test", author="Tester")
+
+        ids = sorted(c.revision_id for c in rp.track_changes)
+        assert ids == [7, 8, 9, 10, 11]
+
+    def it_maps_matches_after_a_tab_to_the_right_run_text(self):
+        doc = Document()
+        para = doc.add_paragraph("a")
+        para.add_run().add_tab()
+        para.add_run("b c")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        count = rp.replace_tracked("b", "Z", author="Tester")
+
+        assert count == 1
+        assert [d.text for d in rp.deletions] == ["b"]
+        assert rp.accepted_text == "aZ c"
+
+    def it_leaves_a_following_run_untouched_when_a_match_ends_at_its_start(self):
+        doc = Document()
+        para = doc.add_paragraph("")
+        para.add_run("Hello ")
+        para.add_run("World")
+        para.add_run("!").bold = True
+        rp = RevisionParagraph.from_paragraph(para)
+
+        rp.replace_tracked("World", "Earth", author="Tester")
+
+        assert rp.runs[-1].text == "!"
+        assert rp.runs[-1].bold is True
+        assert rp.accepted_text == "Hello Earth!"
+
+    def it_skips_matches_across_a_revision_without_half_applying(self):
+        p = parse_xml(
+            f"<w:p {nsdecls('w')}><w:r><w:t>ab</w:t></w:r>"
+            '<w:ins w:id="1" w:author="Prior"><w:r><w:t>X</w:t></w:r></w:ins>'
+            '<w:r><w:t xml:space="preserve">cd bc</w:t></w:r></w:p>'
+        )
+        rp = RevisionParagraph(p, None)  # pyright: ignore[reportArgumentType]
+
+        count = rp.replace_tracked("bc", "Q", author="Bot")
+
+        assert count == 1
+        assert [d.text for d in rp.deletions] == ["bc"]
+        assert rp.accepted_text == "abXcd Q"
+        assert rp.original_text == "abcd bc"
+
+    def it_skips_matches_that_would_drop_a_tab(self):
+        doc = Document()
+        para = doc.add_paragraph("a\tb")
+        rp = RevisionParagraph.from_paragraph(para)
+        before = etree.tostring(para._p)
+
+        assert rp.replace_tracked("ab", "X", author="Bot") == 0
+        assert etree.tostring(para._p) == before
+
+    def it_skips_matches_that_would_drop_a_break(self):
+        doc = Document()
+        para = doc.add_paragraph("Name:")
+        para.add_run().add_break()
+        para.add_run("Bob")
+        rp = RevisionParagraph.from_paragraph(para)
+        before = etree.tostring(para._p)
+
+        assert rp.replace_tracked(":B", "X", author="Bot") == 0
+        assert etree.tostring(para._p) == before
+
+    def it_skips_matches_around_a_hyperlink(self):
+        p = parse_xml(
+            f'<w:p {nsdecls("w")}><w:r><w:t xml:space="preserve">See </w:t></w:r>'
+            "<w:hyperlink><w:r><w:t>link</w:t></w:r></w:hyperlink>"
+            '<w:r><w:t xml:space="preserve"> now</w:t></w:r></w:p>'
+        )
+        rp = RevisionParagraph(p, None)  # pyright: ignore[reportArgumentType]
+        before = etree.tostring(p)
+
+        assert rp.replace_tracked("See  now", "X", author="Bot") == 0
+        assert etree.tostring(p) == before
+
 
 class DescribeRevisionParagraph_replace_tracked_at:
     """Tests for RevisionParagraph.replace_tracked_at."""
@@ -160,6 +281,16 @@ class DescribeRevisionParagraph_replace_tracked_at:
         assert "X" in accepted
         assert "ld" in accepted
 
+    def it_skips_replacing_text_with_itself(self):
+        doc = Document()
+        para = doc.add_paragraph("Hello World")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        rp.replace_tracked_at(6, 11, "World", author="Tester")
+
+        assert rp.has_track_changes is False
+        assert rp.text == "Hello World"
+
     def it_raises_on_invalid_offsets(self):
         doc = Document()
         para = doc.add_paragraph("Hello")
@@ -176,6 +307,140 @@ class DescribeRevisionParagraph_replace_tracked_at:
         with pytest.raises(ValueError, match="Invalid offsets"):
             rp.replace_tracked_at(start=0, end=5, replace_text="test", author="Tester")
 
+    def it_checks_offsets_against_the_run_text_it_splices(self):
+        doc = Document()
+        para = doc.add_paragraph("a")
+        para.add_run("\t")
+        para.add_run("bc")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        rp.replace_tracked_at(start=2, end=3, replace_text="c", author="Tester")
+        assert rp.has_track_changes is False
+
+        rp.replace_tracked_at(start=1, end=2, replace_text="B", author="Tester")
+        assert [d.text for d in rp.deletions] == ["b"]
+        assert rp.accepted_text == "aBc"
+
+        with pytest.raises(ValueError, match="Invalid offsets"):
+            rp.replace_tracked_at(start=3, end=4, replace_text="x", author="Tester")
+
+
+class DescribeRevisionParagraph_apply_tracked_edits:
+    """Tests for RevisionParagraph.apply_tracked_edits."""
+
+    def it_applies_mixed_edits_in_one_pass(self):
+        doc = Document()
+        para = doc.add_paragraph("The quick fox jumps")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        count = rp.apply_tracked_edits([(14, 19, ""), (4, 9, "slow"), (10, 10, "brown ")], author="Bot")
+
+        assert count == 3
+        assert rp.accepted_text == "The slow brown fox "
+        assert rp.original_text == "The quick fox jumps"
+        assert [d.text for d in rp.deletions] == ["quick", "jumps"]
+        assert [i.text for i in rp.insertions] == ["slow", "brown "]
+
+    def it_gives_each_revision_a_unique_id(self):
+        doc = Document()
+        para = doc.add_paragraph("abcdef")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        rp.apply_tracked_edits([(0, 1, "A"), (3, 3, "-"), (5, 6, "")], author="Bot")
+
+        ids = [tc.revision_id for tc in rp.track_changes]
+        assert len(ids) == 4
+        assert len(set(ids)) == 4
+
+    def it_keeps_insertions_at_one_offset_in_order(self):
+        doc = Document()
+        para = doc.add_paragraph("ad")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        rp.apply_tracked_edits([(1, 1, "b"), (1, 1, "c"), (0, 0, "<"), (2, 2, ">")], author="Bot")
+
+        assert rp.accepted_text == "<abcd>"
+        assert rp.original_text == "ad"
+
+    def it_inserts_into_an_empty_paragraph(self):
+        doc = Document()
+        para = doc.add_paragraph("")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        assert rp.apply_tracked_edits([(0, 0, "new")], author="Bot") == 1
+        assert rp.accepted_text == "new"
+
+    def it_skips_spans_replaced_with_themselves(self):
+        doc = Document()
+        para = doc.add_paragraph("Hello World")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        assert rp.apply_tracked_edits([(0, 5, "Hello")], author="Bot") == 0
+        assert rp.has_track_changes is False
+
+    def it_raises_on_overlapping_edits_without_changing_anything(self):
+        doc = Document()
+        para = doc.add_paragraph("Hello World")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        with pytest.raises(ValueError, match="Overlapping"):
+            rp.apply_tracked_edits([(6, 11, "Earth"), (0, 7, "Bye")], author="Bot")
+        assert rp.has_track_changes is False
+
+    def it_raises_on_invalid_offsets(self):
+        doc = Document()
+        para = doc.add_paragraph("Hello")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        with pytest.raises(ValueError, match="Invalid offsets"):
+            rp.apply_tracked_edits([(0, 2, "x"), (3, 9, "y")], author="Bot")
+        with pytest.raises(ValueError, match="Invalid offsets"):
+            rp.apply_tracked_edits([(2, 2, "")], author="Bot")
+        assert rp.has_track_changes is False
+
+    @staticmethod
+    def _para_around_prior(tag: str) -> RevisionParagraph:
+        """``ab`` + a prior ``w:ins`` / ``w:del`` of ``XX`` + ``cd``."""
+        t = "w:delText" if tag == "w:del" else "w:t"
+        p = parse_xml(
+            f"<w:p {nsdecls('w')}><w:r><w:t>ab</w:t></w:r>"
+            f'<{tag} w:id="1" w:author="Prior"><w:r><{t}>XX</{t}></w:r></{tag}>'
+            "<w:r><w:t>cd</w:t></w:r></w:p>"
+        )
+        return RevisionParagraph(p, None)  # pyright: ignore[reportArgumentType]
+
+    def it_raises_on_a_span_around_a_skipped_prior_deletion(self):
+        rp = self._para_around_prior("w:del")
+
+        with pytest.raises(ValueError, match="revision boundary"):
+            rp.apply_tracked_edits([(1, 3, "")], author="Bot", index_mode="accepted")
+        assert rp.accepted_text == "abcd"
+        assert rp.original_text == "abXXcd"
+
+    def it_raises_on_a_span_around_a_visible_prior_insertion(self):
+        rp = self._para_around_prior("w:ins")
+
+        with pytest.raises(ValueError, match="revision boundary"):
+            rp.apply_tracked_edits([(1, 5, "")], author="Bot", index_mode="accepted")
+        assert rp.accepted_text == "abXXcd"
+        assert rp.original_text == "abcd"
+
+    def it_raises_rather_than_drop_non_text_run_content(self):
+        doc = Document()
+        para = doc.add_paragraph("a\tbc")
+        rp = RevisionParagraph.from_paragraph(para)
+        before = etree.tostring(para._p)
+
+        with pytest.raises(ValueError, match="non-text run content"):
+            rp.apply_tracked_edits([(1, 2, "B")], author="Bot")
+        with pytest.raises(ValueError, match="non-text content"):
+            rp.apply_tracked_edits([(1, 1, "-")], author="Bot")
+        assert etree.tostring(para._p) == before
+
+        assert rp.apply_tracked_edits([(0, 0, "<"), (3, 3, ">")], author="Bot") == 2
+        assert rp.accepted_text == "<abc>"
+        assert para.text.count("\t") == 1
+
 
 class DescribeRevisionDocument_find_and_replace_tracked:
     """Tests for RevisionDocument.find_and_replace_tracked."""
@@ -304,3 +569,26 @@ class DescribeRevisionParagraph_accepted_index_mode:
         assert count == 1
         assert any(d.text == "World" for d in rp.deletions)
         assert any(i.text == "Earth" for i in rp.insertions)
+
+    def it_replaces_adjacent_matches_in_accepted_mode(self):
+        doc = Document()
+        para = doc.add_paragraph("XXXX")
+        rp = RevisionParagraph.from_paragraph(para)
+
+        count = rp.replace_tracked("XX", "Y", author="Bot", index_mode="accepted")
+
+        assert count == 2
+        assert rp.accepted_text == "YY"
+        assert rp.original_text == "XXXX"
+
+    def it_replaces_whole_prior_insertions_in_accepted_mode(self):
+        doc = Document()
+        para = doc.add_paragraph("alpha beta gamma beta")
+        rp = RevisionParagraph.from_paragraph(para)
+        rp.replace_tracked("beta", "BETA", author="Prior", index_mode="accepted")
+
+        count = rp.replace_tracked("BETA", "bb", author="Bot", index_mode="accepted")
+
+        assert count == 2
+        assert rp.accepted_text == "alpha bb gamma bb"
+        assert rp.original_text == "alpha beta gamma beta"